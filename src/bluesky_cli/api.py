@@ -1,31 +1,262 @@
 """
 BlueSky API Client with multi-provider AI support
 """
-import requests
 import os
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
-from .utils import get_ai_config, get_bsky_credentials, console
+import time
+import email.utils
+import asyncio
+import contextlib
+import functools
+import aiohttp
+import httpx
+import ijson
+from cachetools import TTLCache
+from typing import AsyncIterator, Callable, Iterable, List, Dict, Any, Optional, Tuple, Union
+from openai import AsyncOpenAI
+from .utils import (
+    get_ai_config, get_bsky_credentials, console, json_loads, load_cached_token, save_cached_token
+)
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 # BlueSky API endpoints
 BSKY_AUTH_ENDPOINT = "https://bsky.social/xrpc/com.atproto.server.createSession"
 BSKY_FEED_ENDPOINT = "https://bsky.social/xrpc/app.bsky.feed.getAuthorFeed"
 BSKY_PROFILE_ENDPOINT = "https://bsky.social/xrpc/app.bsky.actor.getProfile"
+BSKY_PROFILES_ENDPOINT = "https://bsky.social/xrpc/app.bsky.actor.getProfiles"
 BSKY_FOLLOWERS_ENDPOINT = "https://bsky.social/xrpc/app.bsky.graph.getFollowers"
 BSKY_FOLLOWS_ENDPOINT = "https://bsky.social/xrpc/app.bsky.graph.getFollows"
 BSKY_SEARCH_POSTS_ENDPOINT = "https://bsky.social/xrpc/app.bsky.feed.searchPosts"
 BSKY_SEARCH_ACTORS_ENDPOINT = "https://bsky.social/xrpc/app.bsky.actor.searchActors"
 
+# Connection pool and retry policy for XRPC calls
+POOL_LIMIT = 32
+POOL_LIMIT_PER_HOST = 16
+KEEPALIVE_TIMEOUT = 60
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Upper bound on a server-requested wait (Retry-After / ratelimit-reset) before a retry
+MAX_RETRY_WAIT = 60
+
+# Cached session tokens are reused for this many seconds before logging in again
+TOKEN_TTL = 3600
+
+# Profile cache sizing
+PROFILE_CACHE_SIZE = 512
+PROFILE_CACHE_TTL = 300
+
+# Maximum number of concurrent getProfiles calls when hydrating user lists
+PROFILE_CONCURRENCY = 8
+# getProfiles accepts at most this many actors per call
+PROFILES_BATCH_SIZE = 25
+
+# Maximum number of AI completions in flight at once, across all callers
+AI_CONCURRENCY = 8
+
+# Token budget for post text sent to the AI provider
+MAX_PROMPT_TOKENS = 6000
+# Rough characters-per-token ratio used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+# Column order for exported user lists
+CSV_FIELDNAMES = ('handle', 'displayName', 'did', 'description', 'followerCount', 'followingCount')
+
 
 class BlueSkyAPI:
     def __init__(self):
         self.ai_config = get_ai_config()
         self.ai_client = None
+        self._encoder_future: Optional[asyncio.Future] = None
         self._init_ai_client()
 
         self.bsky_auth_token = None
         self.bsky_headers = None
         self.bsky_did = None
+        self.bsky_handle = None
+        self._credentials: Optional[Tuple[str, str]] = None
+        # Created on first use so they bind to the running event loop
+        self._auth_lock: Optional[asyncio.Lock] = None
+        self._ai_semaphore: Optional[asyncio.Semaphore] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._profile_cache = TTLCache(maxsize=PROFILE_CACHE_SIZE, ttl=PROFILE_CACHE_TTL)
+
+    async def __aenter__(self) -> "BlueSkyAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session used for all XRPC calls."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.bsky_headers,
+                connector=aiohttp.TCPConnector(
+                    limit=POOL_LIMIT,
+                    limit_per_host=POOL_LIMIT_PER_HOST,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=300,
+                )
+            )
+        return self._session
+
+    async def _call(
+        self,
+        url: str,
+        *,
+        params: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        error: str = "Request failed",
+    ) -> dict:
+        """Issue an XRPC request and decode its JSON body.
+
+        Any failure is re-raised as a RuntimeError prefixed with `error`.
+        """
+        try:
+            async with self._request(method, url, params=params, json=json) as response:
+                return json_loads(await response.read())
+        except Exception as e:
+            raise RuntimeError(f"{error}: {e}")
+
+    @contextlib.asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Open a successful XRPC response over the pooled session.
+
+        Connection errors and transient statuses are retried with exponential backoff,
+        or after the wait the server asks for in Retry-After / ratelimit-reset;
+        createSession is not retried on status, since it is tightly rate limited.
+        If the access token is refused, the client logs in again and retries once.
+        """
+        session = await self._ensure_session()
+        retry_statuses = RETRY_STATUSES if url != BSKY_AUTH_ENDPOINT else frozenset()
+        attempt = 0
+        refreshed = False
+        while True:
+            rejected = False
+            delay = RETRY_BACKOFF * (2 ** attempt)
+            sent_token = self.bsky_auth_token
+            try:
+                response = await session.request(method, url, params=params, json=json)
+            except aiohttp.ClientConnectionError:
+                if attempt == MAX_RETRIES:
+                    raise
+            else:
+                async with response:
+                    if not refreshed and await self._token_rejected(url, response):
+                        rejected = True
+                    elif response.status not in retry_statuses or attempt == MAX_RETRIES:
+                        response.raise_for_status()
+                        yield response
+                        return
+                    else:
+                        delay = self._retry_delay(response, delay)
+            if rejected:
+                # The access token expired or was revoked
+                refreshed = True
+                await self._refresh_auth(sent_token)
+                continue
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _retry_delay(response: aiohttp.ClientResponse, backoff: float) -> float:
+        """Seconds to wait before retrying, honouring the server's rate-limit hints."""
+        retry_after = response.headers.get("Retry-After")
+        reset = response.headers.get("ratelimit-reset")
+        try:
+            if retry_after:
+                if retry_after.strip().isdigit():
+                    wait = float(retry_after)
+                else:
+                    wait = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+            elif reset:
+                # Epoch seconds at which the rate-limit window reopens
+                wait = float(reset) - time.time()
+            else:
+                return backoff
+        except (TypeError, ValueError):
+            return backoff
+        return min(max(wait, backoff), MAX_RETRY_WAIT)
+
+    async def _stream_fields(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        prefix: str,
+        fields: Dict[str, str],
+        error: str = "Request failed",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Incrementally parse a JSON response, yielding chosen fields of each item under `prefix`.
+
+        `fields` maps a dotted path inside each item to its key in the yielded dict; only
+        those scalar values are kept, so the rest of each item is never built in memory.
+        Missing fields come back as None.
+        """
+        paths = {f"{prefix}.{path}": key for path, key in fields.items()}
+        try:
+            async with self._request("GET", url, params=params) as response:
+                item = None
+                async for path, event, value in ijson.parse(response.content, use_float=True):
+                    if path == prefix:
+                        if event == "start_map":
+                            item = dict.fromkeys(fields.values())
+                        elif event == "end_map":
+                            yield item
+                    elif path in paths and event not in ("start_map", "start_array"):
+                        item[paths[path]] = value
+        except Exception as e:
+            raise RuntimeError(f"{error}: {e}")
+
+    async def _token_rejected(self, url: str, response: aiohttp.ClientResponse) -> bool:
+        """Whether the response refuses our access token in a way a fresh login can fix."""
+        if url == BSKY_AUTH_ENDPOINT or self._credentials is None:
+            return False
+        if response.status == 401:
+            return True
+        return response.status == 400 and b"ExpiredToken" in await response.read()
+
+    async def _refresh_auth(self, rejected_token: Optional[str]) -> None:
+        """Log in again with the last credentials, bypassing the token cache.
+
+        Concurrent requests that hit the same rejected token share one login: whoever
+        gets the lock second sees the token has already changed and skips it.
+        """
+        async with self._get_auth_lock():
+            if self.bsky_auth_token != rejected_token:
+                return
+            await self.authenticate_bsky(*self._credentials, use_cache=False)
+
+    def _get_auth_lock(self) -> asyncio.Lock:
+        """Return the lock that serializes logins."""
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        return self._auth_lock
+
+    async def ensure_authenticated(self, identifier: str = None, password: str = None) -> None:
+        """Log in unless already authenticated, sharing one login across concurrent callers."""
+        async with self._get_auth_lock():
+            if not self.bsky_did:
+                await self.authenticate_bsky(identifier, password)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and AI client."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self.ai_client is not None:
+            await self.ai_client.close()
 
     def _init_ai_client(self):
         """Initialize the AI client based on configured provider."""
@@ -33,13 +264,18 @@ class BlueSkyAPI:
             return
 
         # OpenAI SDK works with OpenAI, Anthropic (via proxy), and Ollama
-        self.ai_client = OpenAI(
+        self.ai_client = AsyncOpenAI(
             api_key=self.ai_config["api_key"],
             base_url=self.ai_config["base_url"],
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            ),
         )
 
-    def authenticate_bsky(self, identifier: str = None, password: str = None) -> bool:
-        """Authenticate with BlueSky API."""
+    async def authenticate_bsky(
+        self, identifier: str = None, password: str = None, use_cache: bool = True
+    ) -> bool:
+        """Authenticate with BlueSky API, reusing a recently cached token when possible."""
         if not identifier or not password:
             conf_id, conf_pass = get_bsky_credentials()
             identifier = identifier or conf_id
@@ -48,26 +284,56 @@ class BlueSkyAPI:
         if not identifier or not password:
             raise ValueError("BlueSky credentials not found.")
 
+        self._credentials = (identifier, password)
+
+        if use_cache:
+            cached = load_cached_token()
+            if (
+                cached
+                and cached.get("identifier") == identifier
+                and time.time() - cached.get("issued", 0) < TOKEN_TTL
+            ):
+                await self._apply_token(cached["jwt"], cached.get("did"), cached.get("handle"))
+                return True
+
         auth_payload = {"identifier": identifier, "password": password}
+        error = "BlueSky authentication failed"
+        auth_data = await self._call(
+            BSKY_AUTH_ENDPOINT, method="POST", json=auth_payload, error=error
+        )
+        token = auth_data.get("accessJwt")
+        if not token:
+            raise RuntimeError(f"{error}: No access token returned")
 
+        await self._apply_token(token, auth_data.get("did"), auth_data.get("handle"))
         try:
-            response = requests.post(BSKY_AUTH_ENDPOINT, json=auth_payload)
-            response.raise_for_status()
-            auth_data = response.json()
-            self.bsky_auth_token = auth_data.get("accessJwt")
-            if not self.bsky_auth_token:
-                raise ValueError("No access token returned")
-
-            self.bsky_did = auth_data.get("did")
-            self.bsky_headers = {
-                "Authorization": f"Bearer {self.bsky_auth_token}",
-                "Content-Type": "application/json"
-            }
-            return True
-        except Exception as e:
-            raise RuntimeError(f"BlueSky authentication failed: {e}")
+            save_cached_token({
+                "identifier": identifier,
+                "jwt": token,
+                "did": self.bsky_did,
+                "handle": self.bsky_handle,
+                "issued": time.time(),
+            })
+        except OSError as e:
+            console.print(f"[yellow]Could not cache session token: {e}[/yellow]")
+        return True
+
+    async def _apply_token(self, token: str, did: Optional[str], handle: Optional[str]) -> None:
+        """Install an access token for all subsequent requests."""
+        self.bsky_auth_token = token
+        self.bsky_did = did
+        self.bsky_handle = handle
+        self.bsky_headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+        # Every later request picks these up from the session defaults
+        session = await self._ensure_session()
+        session.headers.update(self.bsky_headers)
 
-    def format_handle(self, handle: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def format_handle(handle: str) -> str:
         """Format handle for BlueSky API."""
         if handle.startswith("@"):
             handle = handle[1:]
@@ -75,97 +341,180 @@ class BlueSkyAPI:
             handle = f"{handle}.bsky.social"
         return handle
 
-    def get_profile(self, handle: str) -> dict:
+    def _actor_params(self, handle: str, limit: int) -> Dict[str, Any]:
+        """Build the query parameters shared by actor-scoped endpoints."""
+        return {"actor": self.format_handle(handle), "limit": limit}
+
+    async def get_profile(self, handle: str) -> dict:
         """Get user profile."""
         if not self.bsky_headers:
             raise RuntimeError("Not authenticated. Call authenticate_bsky() first.")
         handle = self.format_handle(handle)
+        cached = self._profile_cache.get(handle)
+        if cached is not None:
+            return cached
         params = {"actor": handle}
-        try:
-            response = requests.get(BSKY_PROFILE_ENDPOINT, params=params, headers=self.bsky_headers)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            raise RuntimeError(f"Error fetching profile: {e}")
+        profile = await self._call(
+            BSKY_PROFILE_ENDPOINT, params=params, error="Error fetching profile"
+        )
+        self._profile_cache[handle] = profile
+        return profile
 
-    def get_bsky_posts(self, handle: str, limit: int = 50) -> dict:
+    async def get_bsky_posts(self, handle: str, limit: int = 50) -> dict:
         """Get user's recent posts."""
         if not self.bsky_headers:
             raise RuntimeError("Not authenticated.")
-        handle = self.format_handle(handle)
-        params = {"actor": handle, "limit": limit}
-        try:
-            response = requests.get(BSKY_FEED_ENDPOINT, params=params, headers=self.bsky_headers)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            raise RuntimeError(f"Error fetching posts: {e}")
+        params = self._actor_params(handle, limit)
+        return await self._call(
+            BSKY_FEED_ENDPOINT, params=params, error="Error fetching posts"
+        )
 
-    def get_post_content(self, posts_data: dict) -> str:
-        """Extract text content from posts."""
-        posts = posts_data.get("feed", [])
-        combined_text = ""
-        for item in posts:
-            post_view = item.get("post", {})
-            record = post_view.get("record", {})
-            text = record.get("text", "")
-            if text:
-                combined_text += text + "\n"
+    async def stream_feed_stats(self, handle: str, limit: int = 50) -> AsyncIterator[dict]:
+        """Stream the text, timestamp, like and repost counts of each post in a user's feed."""
+        if not self.bsky_headers:
+            raise RuntimeError("Not authenticated.")
+        params = self._actor_params(handle, limit)
+        fields = {
+            "post.record.text": "text",
+            "post.record.createdAt": "createdAt",
+            "post.likeCount": "likeCount",
+            "post.repostCount": "repostCount",
+        }
+        error = "Error fetching posts"
+        async for post in self._stream_fields(
+            BSKY_FEED_ENDPOINT, params, "feed.item", fields, error
+        ):
+            yield post
+
+    async def stream_feed_texts(self, handle: str, limit: int = 50) -> AsyncIterator[dict]:
+        """Stream just the text and timestamp of each post in a user's feed."""
+        if not self.bsky_headers:
+            raise RuntimeError("Not authenticated.")
+        params = self._actor_params(handle, limit)
+        fields = {"post.record.text": "text", "post.record.createdAt": "createdAt"}
+        error = "Error fetching posts"
+        async for record in self._stream_fields(
+            BSKY_FEED_ENDPOINT, params, "feed.item", fields, error
+        ):
+            yield {"text": record["text"] or "", "createdAt": record["createdAt"]}
+
+    async def get_feed_text(self, handle: str, limit: int = 50) -> str:
+        """Fetch a user's recent posts and return their combined text."""
+        texts = [p["text"] async for p in self.stream_feed_texts(handle, limit) if p["text"]]
+        # Reposts and quotes often repeat the same text; send each one only once
+        combined_text = "\n".join(dict.fromkeys(texts))
         if not combined_text.strip():
             raise ValueError("No post texts found.")
         return combined_text.strip()
 
-    def get_followers(self, handle: str, limit: int = 50) -> dict:
+    def get_post_content(self, posts_data: dict) -> str:
+        """Extract text content from posts."""
+        texts = [
+            item["post"]["record"]["text"]
+            for item in posts_data.get("feed", [])
+            if item.get("post", {}).get("record", {}).get("text")
+        ]
+        combined_text = "\n".join(dict.fromkeys(texts)).strip()
+        if not combined_text:
+            raise ValueError("No post texts found.")
+        return combined_text
+
+    async def get_followers(self, handle: str, limit: int = 50) -> dict:
         """Get user's followers."""
         if not self.bsky_headers:
             raise RuntimeError("Not authenticated.")
-        handle = self.format_handle(handle)
-        params = {"actor": handle, "limit": limit}
-        try:
-            response = requests.get(BSKY_FOLLOWERS_ENDPOINT, params=params, headers=self.bsky_headers)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            raise RuntimeError(f"Error fetching followers: {e}")
+        params = self._actor_params(handle, limit)
+        return await self._call(
+            BSKY_FOLLOWERS_ENDPOINT, params=params, error="Error fetching followers"
+        )
 
-    def get_follows(self, handle: str, limit: int = 50) -> dict:
+    async def get_follows(self, handle: str, limit: int = 50) -> dict:
         """Get users the handle follows."""
         if not self.bsky_headers:
             raise RuntimeError("Not authenticated.")
-        handle = self.format_handle(handle)
-        params = {"actor": handle, "limit": limit}
-        try:
-            response = requests.get(BSKY_FOLLOWS_ENDPOINT, params=params, headers=self.bsky_headers)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            raise RuntimeError(f"Error fetching follows: {e}")
+        params = self._actor_params(handle, limit)
+        return await self._call(
+            BSKY_FOLLOWS_ENDPOINT, params=params, error="Error fetching follows"
+        )
 
-    def search_posts(self, query: str, limit: int = 20) -> dict:
+    async def search_posts(self, query: str, limit: int = 20) -> dict:
         """Search posts by keyword."""
         if not self.bsky_headers:
             raise RuntimeError("Not authenticated.")
         params = {"q": query, "limit": limit}
-        try:
-            response = requests.get(BSKY_SEARCH_POSTS_ENDPOINT, params=params, headers=self.bsky_headers)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            raise RuntimeError(f"Error searching posts: {e}")
+        return await self._call(
+            BSKY_SEARCH_POSTS_ENDPOINT, params=params, error="Error searching posts"
+        )
 
-    def search_users(self, query: str, limit: int = 20) -> dict:
+    async def search_users(self, query: str, limit: int = 20) -> dict:
         """Search users by keyword."""
         if not self.bsky_headers:
             raise RuntimeError("Not authenticated.")
         params = {"q": query, "limit": limit}
+        return await self._call(
+            BSKY_SEARCH_ACTORS_ENDPOINT, params=params, error="Error searching users"
+        )
+
+    def _load_encoder(self):
+        """Load the tokenizer for the configured model; this may download its encoding file."""
         try:
-            response = requests.get(BSKY_SEARCH_ACTORS_ENDPOINT, params=params, headers=self.bsky_headers)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            raise RuntimeError(f"Error searching users: {e}")
+            return tiktoken.encoding_for_model(self.ai_config["model"])
+        except KeyError:
+            # Non-OpenAI models: cl100k_base is a close enough approximation for budgeting
+            return tiktoken.get_encoding("cl100k_base")
 
-    def vibe_check(self, text: str) -> str:
+    async def _get_encoder(self):
+        """Return a tokenizer for the configured model, or None if one cannot be loaded."""
+        if tiktoken is None:
+            return None
+        if self._encoder_future is None:
+            # Loading can hit the network, so run it once in a worker thread
+            loop = asyncio.get_running_loop()
+            self._encoder_future = loop.run_in_executor(None, self._load_encoder)
+        try:
+            return await self._encoder_future
+        except Exception:
+            return None
+
+    async def _trim_prompt_text(self, text: str) -> str:
+        """Truncate text to MAX_PROMPT_TOKENS before it is sent to the AI provider."""
+        encoder = await self._get_encoder()
+        if encoder is None:
+            return text[:MAX_PROMPT_TOKENS * CHARS_PER_TOKEN]
+        # Post text is user-supplied, so strings like <|endoftext|> are plain text here
+        tokens = encoder.encode_ordinary(text)
+        if len(tokens) <= MAX_PROMPT_TOKENS:
+            return text
+        return encoder.decode(tokens[:MAX_PROMPT_TOKENS])
+
+    async def _complete(
+        self, messages: List[dict], on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Stream a chat completion, passing each text delta to `on_delta` as it arrives.
+
+        At most AI_CONCURRENCY completions run at once; the rest wait for a slot.
+        """
+        if self._ai_semaphore is None:
+            self._ai_semaphore = asyncio.Semaphore(AI_CONCURRENCY)
+        async with self._ai_semaphore:
+            stream = await self.ai_client.chat.completions.create(
+                model=self.ai_config["model"],
+                messages=messages,
+                temperature=0.3,
+                stream=True,
+            )
+            parts = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if on_delta is not None:
+                        on_delta(delta)
+        return "".join(parts).strip()
+
+    async def vibe_check(self, text: str, on_delta: Optional[Callable[[str], None]] = None) -> str:
         """Analyze user's posting vibe using AI."""
         if not self.ai_client:
             raise RuntimeError(f"AI not configured. Set OPENAI_API_KEY, ANTHROPIC_API_KEY, or use Ollama.")
@@ -178,106 +527,152 @@ class BlueSkyAPI:
 Be concise but insightful."""
 
         try:
-            completion = self.ai_client.chat.completions.create(
-                model=self.ai_config["model"],
-                messages=[
+            text = await self._trim_prompt_text(text)
+            return await self._complete(
+                [
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": f"Analyze these BlueSky posts:\n\n{text}"}
                 ],
-                temperature=0.3,
+                on_delta,
             )
-            return completion.choices[0].message.content.strip()
         except Exception as e:
             raise RuntimeError(f"Error performing vibe check: {e}")
 
-    def summarize_text(self, text: str) -> str:
+    async def summarize_text(
+        self, text: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
         """Summarize posts using AI."""
         if not self.ai_client:
             raise RuntimeError("AI not configured.")
         try:
+            text = await self._trim_prompt_text(text)
             prompt = f"Summarize these BlueSky posts concisely, capturing key themes:\n\n{text}"
-            completion = self.ai_client.chat.completions.create(
-                model=self.ai_config["model"],
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-            )
-            return completion.choices[0].message.content.strip()
+            return await self._complete([{"role": "user", "content": prompt}], on_delta)
         except Exception as e:
             raise RuntimeError(f"Error summarizing: {e}")
 
-    def get_all_followers(self, handle: str, max_results: int = 1000, batch_size: int = 100) -> List[dict]:
-        """Get all followers with pagination."""
-        if not self.bsky_headers:
-            raise RuntimeError("Not authenticated.")
-        handle = self.format_handle(handle)
-        all_followers = []
+    async def _paginate(
+        self, url: str, key: str, handle: str, batch_size: int
+    ) -> AsyncIterator[dict]:
+        """Walk a cursor-paginated actor endpoint, yielding each entry under `key`."""
         cursor = None
-
-        while max_results == 0 or len(all_followers) < max_results:
-            params = {"actor": handle, "limit": batch_size}
+        while True:
+            params = self._actor_params(handle, batch_size)
             if cursor:
                 params["cursor"] = cursor
-            try:
-                r = requests.get(BSKY_FOLLOWERS_ENDPOINT, params=params, headers=self.bsky_headers)
-                r.raise_for_status()
-                data = r.json()
-                all_followers.extend(data.get("followers", []))
-                cursor = data.get("cursor")
-                if not cursor:
+            data = await self._call(url, params=params, error=f"Error fetching {key}")
+            for user in data.get(key, []):
+                yield user
+            cursor = data.get("cursor")
+            if not cursor:
+                return
+
+    async def _collect(self, users: AsyncIterator[dict], max_results: int) -> List[dict]:
+        """Drain a user iterator into a list, stopping at max_results (0 means no limit)."""
+        collected = []
+        try:
+            async for user in users:
+                collected.append(user)
+                if max_results > 0 and len(collected) >= max_results:
                     break
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
-                break
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+        finally:
+            await users.aclose()
+        return collected
 
-        if max_results > 0:
-            all_followers = all_followers[:max_results]
-        return all_followers
+    async def iter_followers(self, handle: str, batch_size: int = 100) -> AsyncIterator[dict]:
+        """Yield followers one at a time, fetching the next page only when needed."""
+        if not self.bsky_headers:
+            raise RuntimeError("Not authenticated.")
+        async for user in self._paginate(BSKY_FOLLOWERS_ENDPOINT, "followers", handle, batch_size):
+            yield user
 
-    def get_all_follows(self, handle: str, max_results: int = 1000, batch_size: int = 100) -> List[dict]:
+    async def iter_follows(self, handle: str, batch_size: int = 100) -> AsyncIterator[dict]:
+        """Yield follows one at a time, fetching the next page only when needed."""
+        if not self.bsky_headers:
+            raise RuntimeError("Not authenticated.")
+        async for user in self._paginate(BSKY_FOLLOWS_ENDPOINT, "follows", handle, batch_size):
+            yield user
+
+    async def get_all_followers(
+        self, handle: str, max_results: int = 1000, batch_size: int = 100
+    ) -> List[dict]:
+        """Get all followers with pagination."""
+        if not self.bsky_headers:
+            raise RuntimeError("Not authenticated.")
+        return await self._collect(self.iter_followers(handle, batch_size), max_results)
+
+    async def get_all_follows(
+        self, handle: str, max_results: int = 1000, batch_size: int = 100
+    ) -> List[dict]:
         """Get all follows with pagination."""
         if not self.bsky_headers:
             raise RuntimeError("Not authenticated.")
-        handle = self.format_handle(handle)
-        all_follows = []
-        cursor = None
+        return await self._collect(self.iter_follows(handle, batch_size), max_results)
 
-        while max_results == 0 or len(all_follows) < max_results:
-            params = {"actor": handle, "limit": batch_size}
-            if cursor:
-                params["cursor"] = cursor
-            try:
-                r = requests.get(BSKY_FOLLOWS_ENDPOINT, params=params, headers=self.bsky_headers)
-                r.raise_for_status()
-                data = r.json()
-                all_follows.extend(data.get("follows", []))
-                cursor = data.get("cursor")
-                if not cursor:
-                    break
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
-                break
+    async def get_all_followers_and_follows(
+        self, handle: str, max_results: int = 1000, batch_size: int = 100
+    ) -> Tuple[List[dict], List[dict]]:
+        """Walk the follower and follow paginations side by side."""
+        followers, follows = await asyncio.gather(
+            self.get_all_followers(handle, max_results, batch_size),
+            self.get_all_follows(handle, max_results, batch_size),
+        )
+        return followers, follows
+
+    async def get_profiles(
+        self, users: List[dict], concurrency: int = PROFILE_CONCURRENCY
+    ) -> List[dict]:
+        """Hydrate a user list with full profiles via batched getProfiles calls.
+
+        At most `concurrency` batches are in flight. A user whose batch fails, or who
+        is missing from the response, keeps their original list entry.
+        """
+        if not self.bsky_headers:
+            raise RuntimeError("Not authenticated.")
+        dids = list(dict.fromkeys(u["did"] for u in users if u.get("did")))
+        sem = asyncio.Semaphore(concurrency)
+        profiles: Dict[str, dict] = {}
+
+        async def fetch(batch: List[str]) -> None:
+            async with sem:
+                try:
+                    data = await self._call(
+                        BSKY_PROFILES_ENDPOINT,
+                        params=[("actors", did) for did in batch],
+                        error="Error fetching profiles",
+                    )
+                except RuntimeError:
+                    return
+            for profile in data.get("profiles", []):
+                profiles[profile.get("did")] = profile
 
-        if max_results > 0:
-            all_follows = all_follows[:max_results]
-        return all_follows
+        await asyncio.gather(*[
+            fetch(dids[i:i + PROFILES_BATCH_SIZE])
+            for i in range(0, len(dids), PROFILES_BATCH_SIZE)
+        ])
+        return [profiles.get(u.get("did"), u) for u in users]
 
-    def save_user_list_to_csv(self, users: List[dict], filename: str) -> bool:
+    def save_user_list_to_csv(self, users: Iterable[dict], filename: str) -> bool:
         """Export user list to CSV."""
         import csv
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['handle', 'displayName', 'did', 'description', 'followerCount', 'followingCount']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for user in users:
-                    writer.writerow({
-                        'handle': user.get('handle', ''),
-                        'displayName': user.get('displayName', ''),
-                        'did': user.get('did', ''),
-                        'description': user.get('description', ''),
-                        'followerCount': user.get('followerCount', 0),
-                        'followingCount': user.get('followingCount', 0)
-                    })
+                writer = csv.writer(csvfile)
+                writer.writerow(CSV_FIELDNAMES)
+                writer.writerows(
+                    (
+                        user.get('handle', ''),
+                        user.get('displayName', ''),
+                        user.get('did', ''),
+                        user.get('description', ''),
+                        # Profile views name these followersCount/followsCount
+                        user.get('followersCount', 0),
+                        user.get('followsCount', 0),
+                    )
+                    for user in users
+                )
             return True
         except Exception as e:
             console.print(f"[red]Error saving CSV: {e}[/red]")
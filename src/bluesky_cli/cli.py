@@ -4,74 +4,136 @@ BlueSky CLI Tool
 """
 import os
 import sys
+import asyncio
 import argparse
-import inquirer
-from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
+from rich.live import Live
+from rich.prompt import Prompt
+from rich.table import Table
 from .api import BlueSkyAPI
 from .utils import console
 
+ACTIONS = [
+    ('View user profile', 'profile'),
+    ('Get recent posts', 'posts'),
+    ('Get post summary', 'summary'),
+    ('Perform vibe check', 'vibe'),
+    ('View followers', 'followers'),
+    ('View following', 'following'),
+    ('View followers and following', 'network'),
+    ('Exit', 'exit')
+]
+
+# Maximum number of users shown per list for the followers/following actions
+USER_LIST_LIMIT = 100
+
+parser = argparse.ArgumentParser(description="BlueSky CLI")
+parser.add_argument("--interactive", "-i", action="store_true", help="Interactive mode")
+
 def interactive_menu():
     console.print(Panel.fit("[bold cyan]BlueSky API Interaction Tool[/bold cyan]", border_style="cyan"))
-    
-    questions = [
-        inquirer.List('action',
-            message="What would you like to do?",
-            choices=[
-                ('View user profile', 'profile'),
-                ('Get recent posts', 'posts'),
-                ('Get post summary', 'summary'),
-                ('Perform vibe check', 'vibe'),
-                ('View followers', 'followers'),
-                ('View following', 'following'),
-                ('Exit', 'exit')
-            ],
-        )
-    ]
-    answers = inquirer.prompt(questions)
-    if answers['action'] == 'exit':
+
+    for number, (label, _) in enumerate(ACTIONS, start=1):
+        console.print(f"  [cyan]{number}[/cyan]. {label}")
+    choice = Prompt.ask(
+        "What would you like to do?",
+        choices=[str(n) for n in range(1, len(ACTIONS) + 1)],
+        show_choices=False,
+        console=console,
+    )
+    action = ACTIONS[int(choice) - 1][1]
+    if action == 'exit':
         sys.exit(0)
 
-    bsky = BlueSkyAPI()
-    try:
-        bsky.authenticate_bsky()
-    except Exception as e:
-        console.print(f"[bold red]Authentication failed: {e}[/bold red]")
-        console.print("[dim]Please set BSKY_IDENTIFIER and BSKY_PASSWORD in environment or config.[/dim]")
-        return
+    h = Prompt.ask("Enter BlueSky handle", console=console)
+    asyncio.run(run_action(action, h))
 
-    if answers['action'] == 'profile':
-        h = inquirer.text(message="Enter BlueSky handle")
+async def run_action(action, h):
+    async with BlueSkyAPI() as bsky:
         try:
-            profile = bsky.get_profile(h)
-            console.print(profile)
+            await bsky.authenticate_bsky()
         except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
-            
-    elif answers['action'] == 'posts':
-        h = inquirer.text(message="Enter BlueSky handle")
-        try:
-            posts = bsky.get_bsky_posts(h)
-            console.print(f"Fetched {len(posts.get('feed', []))} posts")
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
-
-    elif answers['action'] == 'vibe':
-         h = inquirer.text(message="Enter BlueSky handle")
-         try:
-             posts = bsky.get_bsky_posts(h)
-             text = bsky.get_post_content(posts)
-             vibe = bsky.vibe_check(text)
-             console.print(Panel(vibe, title="Vibe Check"))
-         except Exception as e:
-             console.print(f"[red]Error: {e}[/red]")
-             
-    # Implement others as needed, keeping it simple for the refactor
+            console.print(f"[bold red]Authentication failed: {e}[/bold red]")
+            console.print("[dim]Please set BSKY_IDENTIFIER and BSKY_PASSWORD in environment or config.[/dim]")
+            return
+
+        if action == 'profile':
+            try:
+                profile = await bsky.get_profile(h)
+                console.print(profile)
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+
+        elif action == 'posts':
+            try:
+                posts = await bsky.get_bsky_posts(h)
+                console.print(f"Fetched {len(posts.get('feed', []))} posts")
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+
+        elif action == 'vibe':
+            try:
+                text = await bsky.get_feed_text(h)
+                panel = Panel("", title="Vibe Check")
+                with Live(panel, console=console, refresh_per_second=8) as live:
+                    parts = []
+
+                    def show(delta):
+                        parts.append(delta)
+                        live.update(Panel("".join(parts), title="Vibe Check"))
+
+                    await bsky.vibe_check(text, on_delta=show)
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+
+        elif action in ('followers', 'following'):
+            try:
+                if action == 'followers':
+                    users = await bsky.get_all_followers(h, max_results=USER_LIST_LIMIT)
+                else:
+                    users = await bsky.get_all_follows(h, max_results=USER_LIST_LIMIT)
+                # List entries carry no follower counts, so fetch full profiles in batches
+                users = await bsky.get_profiles(users)
+                label = "Followers of" if action == 'followers' else "Followed by"
+                show_user_table(users, title=f"{label} {h}")
+                filename = Prompt.ask(
+                    "Save to CSV (leave blank to skip)", default="", console=console
+                )
+                if filename and bsky.save_user_list_to_csv(users, filename):
+                    console.print(f"Saved {len(users)} users to {filename}")
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+
+        elif action == 'network':
+            try:
+                followers, follows = await bsky.get_all_followers_and_follows(
+                    h, max_results=USER_LIST_LIMIT
+                )
+                users = await bsky.get_profiles(followers + follows)
+                show_user_table(users[:len(followers)], title=f"Followers of {h}")
+                show_user_table(users[len(followers):], title=f"Followed by {h}")
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+
+        # Implement others as needed, keeping it simple for the refactor
+
+def show_user_table(users, title):
+    table = Table(title=title)
+    table.add_column("Handle", style="cyan")
+    table.add_column("Name")
+    table.add_column("Followers", justify="right")
+    table.add_column("Following", justify="right")
+    for user in users:
+        table.add_row(
+            user.get('handle', ''),
+            user.get('displayName', ''),
+            str(user.get('followersCount', '')),
+            str(user.get('followsCount', '')),
+        )
+    console.print(table)
 
 def main():
-    parser = argparse.ArgumentParser(description="BlueSky CLI")
-    parser.add_argument("--interactive", "-i", action="store_true", help="Interactive mode")
     args = parser.parse_args()
 
     if args.interactive:
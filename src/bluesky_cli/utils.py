@@ -3,10 +3,17 @@ BlueSky CLI Utilities
 """
 import os
 import json
+import functools
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Constants
 APP_NAME = "bluesky-cli"
 CONFIG_DIR = Path.home() / ".config" / APP_NAME
@@ -18,6 +25,7 @@ for directory in [CONFIG_DIR, CACHE_DIR, LOG_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
 
 CONFIG_FILE = CONFIG_DIR / "config.json"
+TOKEN_FILE = CACHE_DIR / "token.json"
 
 console = Console()
 
@@ -41,16 +49,39 @@ PROVIDERS = {
 }
 
 
-def load_config() -> Dict[str, Any]:
-    """Load configuration from file or environment."""
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Encode JSON to a string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _config_mtime() -> Optional[int]:
+    """Return the config file's modification time, or None if it does not exist."""
+    try:
+        return CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config(mtime_ns: Optional[int]) -> Dict[str, Any]:
+    """Read and merge the config file and environment; re-read only when the file changes."""
     config = {}
 
     # Load from file
-    if CONFIG_FILE.exists():
+    if mtime_ns is not None:
         try:
             with open(CONFIG_FILE, 'r') as f:
                 config = json.load(f)
-        except json.JSONDecodeError:
+        except (OSError, json.JSONDecodeError):
             pass
 
     # Environment variables override file config
@@ -72,15 +103,30 @@ def load_config() -> Dict[str, Any]:
     return config
 
 
+def _current_config() -> Dict[str, Any]:
+    """Return the shared cached config. Callers must not mutate it."""
+    return _read_config(_config_mtime())
+
+
+def load_config() -> Dict[str, Any]:
+    """Load configuration from file or environment."""
+    return dict(_current_config())
+
+
 def save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file."""
     with open(CONFIG_FILE, 'w') as f:
         json.dump(config, f, indent=2)
+    clear_config_cache()
 
 
-def get_ai_provider() -> str:
-    """Get the configured AI provider (openai, anthropic, or ollama)."""
-    config = load_config()
+def clear_config_cache() -> None:
+    """Drop the cached configuration so the next lookup re-reads it."""
+    _read_config.cache_clear()
+
+
+def _pick_provider(config: Dict[str, Any]) -> str:
+    """Resolve the AI provider named in a config snapshot, defaulting to openai."""
     provider = config.get("ai_provider", "openai").lower()
 
     # Validate provider
@@ -89,11 +135,8 @@ def get_ai_provider() -> str:
     return provider
 
 
-def get_ai_api_key() -> Optional[str]:
-    """Get the API key for the configured provider."""
-    config = load_config()
-    provider = get_ai_provider()
-
+def _pick_key(config: Dict[str, Any], provider: str) -> Optional[str]:
+    """Resolve the API key for a provider from a config snapshot or the environment."""
     if provider == "ollama":
         return "ollama"  # No key needed, return placeholder
 
@@ -106,14 +149,25 @@ def get_ai_api_key() -> Optional[str]:
     return os.getenv(env_key) if env_key else None
 
 
+def get_ai_provider() -> str:
+    """Get the configured AI provider (openai, anthropic, or ollama)."""
+    return _pick_provider(_current_config())
+
+
+def get_ai_api_key() -> Optional[str]:
+    """Get the API key for the configured provider."""
+    config = _current_config()
+    return _pick_key(config, _pick_provider(config))
+
+
 def get_ai_config() -> Dict[str, Any]:
     """Get full AI configuration for the current provider."""
-    provider = get_ai_provider()
-    api_key = get_ai_api_key()
+    config = _current_config()
+    provider = _pick_provider(config)
 
     return {
         "provider": provider,
-        "api_key": api_key,
+        "api_key": _pick_key(config, provider),
         "base_url": PROVIDERS[provider]["base_url"],
         "model": PROVIDERS[provider]["default_model"]
     }
@@ -121,5 +175,34 @@ def get_ai_config() -> Dict[str, Any]:
 
 def get_bsky_credentials() -> Tuple[Optional[str], Optional[str]]:
     """Get BlueSky credentials (identifier, password)."""
-    config = load_config()
+    config = _current_config()
     return config.get("bsky_identifier"), config.get("bsky_password")
+
+
+def load_cached_token() -> Optional[Dict[str, Any]]:
+    """Load the cached BlueSky session token, if a usable one was saved."""
+    try:
+        with open(TOKEN_FILE, 'r') as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    # Anything else is a damaged cache; treat it as a miss so the next login overwrites it
+    if (
+        not isinstance(cached, dict)
+        or not isinstance(cached.get("jwt"), str)
+        or not isinstance(cached.get("issued", 0), (int, float))
+    ):
+        return None
+    return cached
+
+
+def save_cached_token(token: Dict[str, Any]) -> None:
+    """Atomically write the BlueSky session token cache (owner-readable only)."""
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=".token-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(token, f)
+        os.replace(tmp_path, TOKEN_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
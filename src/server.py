@@ -1,34 +1,46 @@
 #!/usr/bin/env python3
 import sys
-import json
+import asyncio
 import logging
 import os
+import time
 from pathlib import Path
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 try:
     from bluesky_cli.api import BlueSkyAPI
+    from bluesky_cli.utils import json_dumps, json_loads
 except ImportError:
     # Try local import if running from src
     sys.path.append(os.path.dirname(__file__))
     from bluesky_cli.api import BlueSkyAPI
+    from bluesky_cli.utils import json_dumps, json_loads
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("bluesky-mcp")
 
 api = BlueSkyAPI()
 
+# Maximum number of handles processed at once by the batch vibe check
+BATCH_CONCURRENCY = 8
+
+# Streamed AI text is sent as a progress notification once this many characters
+# have built up, or this many seconds have passed since the last one
+PROGRESS_MIN_CHARS = 200
+PROGRESS_INTERVAL = 0.25
+
 # Auto-authenticate if env vars are present
 BSKY_HANDLE = os.getenv("BSKY_HANDLE")
 BSKY_PASSWORD = os.getenv("BSKY_PASSWORD")
 
-if BSKY_HANDLE and BSKY_PASSWORD:
-    try:
-        api.authenticate_bsky(BSKY_HANDLE, BSKY_PASSWORD)
-        logger.info(f"Authenticated as {BSKY_HANDLE}")
-    except Exception as e:
-        logger.error(f"Auth failed: {e}")
+async def authenticate_from_env():
+    if BSKY_HANDLE and BSKY_PASSWORD:
+        try:
+            await api.authenticate_bsky(BSKY_HANDLE, BSKY_PASSWORD)
+            logger.info(f"Authenticated as {BSKY_HANDLE}")
+        except Exception as e:
+            logger.error(f"Auth failed: {e}")
 
 def list_tools():
     return [
@@ -78,40 +90,55 @@ def list_tools():
                 },
                 "required": ["handle"]
             }
+        },
+        {
+            "name": "dream_bsky_vibe_check_batch",
+            "description": (
+                "Analyze the 'vibe' of several users at once, "
+                "fetching and analyzing them concurrently."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "handles": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "User handles"
+                    }
+                },
+                "required": ["handles"]
+            }
         }
     ]
 
-def handle_call_tool(name, arguments):
+async def handle_call_tool(name, arguments, on_delta=None):
     if not api.bsky_did and not (BSKY_HANDLE and BSKY_PASSWORD):
          return {"content": [{"type": "text", "text": "Error: BSKY_HANDLE and BSKY_PASSWORD environment variables not set."}], "isError": True}
     
-    # Ensure authenticated
+    # Ensure authenticated; concurrent calls wait for a single login
     if not api.bsky_did:
         try:
-             api.authenticate_bsky(BSKY_HANDLE, BSKY_PASSWORD)
+             await api.ensure_authenticated(BSKY_HANDLE, BSKY_PASSWORD)
         except Exception as e:
              return {"content": [{"type": "text", "text": f"Authentication failed: {e}"}], "isError": True}
 
     try:
         if name == "dream_bsky_get_profile":
-            profile = api.get_profile(arguments["handle"])
-            return {"content": [{"type": "text", "text": json.dumps(profile, indent=2)}]}
+            profile = await api.get_profile(arguments["handle"])
+            return {"content": [{"type": "text", "text": json_dumps(profile, indent=True)}]}
             
         elif name == "dream_bsky_get_feed":
             limit = arguments.get("limit", 20)
-            feed = api.get_bsky_posts(arguments["handle"], limit=limit)
             # Summarize or extract text to save context
             clean_feed = []
-            for item in feed.get('feed', []):
-                 post = item.get('post', {})
-                 record = post.get('record', {})
+            async for post in api.stream_feed_stats(arguments["handle"], limit=limit):
                  clean_feed.append({
-                     'text': record.get('text'),
-                     'created_at': record.get('createdAt'),
-                     'likes': post.get('likeCount'),
-                     'reposts': post.get('repostCount')
+                     'text': post['text'],
+                     'created_at': post['createdAt'],
+                     'likes': post['likeCount'],
+                     'reposts': post['repostCount']
                  })
-            return {"content": [{"type": "text", "text": json.dumps(clean_feed, indent=2)}]}
+            return {"content": [{"type": "text", "text": json_dumps(clean_feed, indent=True)}]}
             
         elif name == "dream_bsky_search":
             query = arguments["query"]
@@ -119,7 +146,7 @@ def handle_call_tool(name, arguments):
             search_type = arguments.get("type", "posts")
             
             if search_type == "posts":
-                res = api.search_posts(query, limit)
+                res = await api.search_posts(query, limit)
                 # Cleaning search results
                 clean_res = []
                 for post in res.get('posts', []):
@@ -128,63 +155,175 @@ def handle_call_tool(name, arguments):
                         'text': post.get('record', {}).get('text'),
                         'created_at': post.get('record', {}).get('createdAt')
                     })
-                return {"content": [{"type": "text", "text": json.dumps(clean_res, indent=2)}]}
+                return {"content": [{"type": "text", "text": json_dumps(clean_res, indent=True)}]}
             else:
-                res = api.search_users(query, limit)
-                return {"content": [{"type": "text", "text": json.dumps(res.get('actors', []), indent=2)}]}
+                res = await api.search_users(query, limit)
+                return {"content": [{"type": "text", "text": json_dumps(res.get('actors', []), indent=True)}]}
 
         elif name == "dream_bsky_vibe_check":
             handle = arguments["handle"]
             # 1. Get posts
-            feed = api.get_bsky_posts(handle, limit=50)
-            text = api.get_post_content(feed)
+            text = await api.get_feed_text(handle, limit=50)
             if not text:
                  return {"content": [{"type": "text", "text": f"No text found for {handle} to analyze."}]}
             
             # 2. Vibe Check
             # Note: This relies on api.ai_client which needs OPENAI/ANTHROPIC keys in env too
             try:
-                analysis = api.vibe_check(text)
+                analysis = await api.vibe_check(text, on_delta=on_delta)
                 return {"content": [{"type": "text", "text": analysis}]}
             except Exception as e:
                  return {"content": [{"type": "text", "text": f"AI Analysis failed: {e}. Check API keys."}], "isError": True}
 
+        elif name == "dream_bsky_vibe_check_batch":
+            handles = arguments["handles"]
+            if not isinstance(handles, list) or not all(isinstance(h, str) for h in handles):
+                error = "handles must be a list of strings."
+                return {"content": [{"type": "text", "text": error}], "isError": True}
+
+            sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+            async def one(handle):
+                async with sem:
+                    try:
+                        text = await api.get_feed_text(handle, limit=50)
+                        return {"handle": handle, "analysis": await api.vibe_check(text)}
+                    except Exception as e:
+                        return {"handle": handle, "error": str(e)}
+
+            results = await asyncio.gather(*[one(h) for h in handles])
+            return {"content": [{"type": "text", "text": json_dumps(results, indent=True)}]}
+
         return {"content": [{"type": "text", "text": f"Tool not found: {name}"}], "isError": True}
         
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error executing {name}: {str(e)}"}], "isError": True}
 
-def run_server():
-    while True:
-        try:
-            line = sys.stdin.readline()
+def send(message):
+    # Each message is written and flushed in one synchronous step, so output from
+    # concurrent tasks on the event loop can never interleave mid-line.
+    sys.stdout.write(json_dumps(message) + "\n")
+    sys.stdout.flush()
+
+def send_error(code, message, req_id=None):
+    send({"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}})
+
+def progress_notifier(token):
+    """Build (notify, flush) callbacks that forward streamed AI text as MCP progress notifications.
+
+    Deltas are coalesced so an analysis produces a handful of notifications rather than
+    one per token; flush() sends whatever is still buffered. The text travels in
+    params.message, a non-standard extension under protocol 2024-11-05: clients that
+    follow that revision strictly may ignore it and only see the progress count.
+    """
+    progress = 0
+    pending = []
+    pending_chars = 0
+    last_sent = time.monotonic()
+
+    def flush():
+        nonlocal progress, pending_chars, last_sent
+        if not pending:
+            return
+        progress += 1
+        send({
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {"progressToken": token, "progress": progress, "message": "".join(pending)}
+        })
+        pending.clear()
+        pending_chars = 0
+        last_sent = time.monotonic()
+
+    def notify(delta):
+        nonlocal pending_chars
+        pending.append(delta)
+        pending_chars += len(delta)
+        if (
+            pending_chars >= PROGRESS_MIN_CHARS
+            or time.monotonic() - last_sent >= PROGRESS_INTERVAL
+        ):
+            flush()
+
+    return notify, flush
+
+async def dispatch(request):
+    req_id = request.get("id")
+
+    response = {"jsonrpc": "2.0", "id": req_id}
+
+    try:
+        if request.get("method") == "initialize":
+            response["result"] = {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "geepers-bluesky", "version": "1.0.0"}
+            }
+        elif request.get("method") == "tools/list":
+            response["result"] = {"tools": list_tools()}
+        elif request.get("method") == "tools/call":
+            params = request["params"]
+            token = params.get("_meta", {}).get("progressToken")
+            on_delta = flush = None
+            if token is not None:
+                on_delta, flush = progress_notifier(token)
+            result = await handle_call_tool(params["name"], params["arguments"], on_delta)
+            if flush is not None:
+                # Deliver the buffered tail before the final response
+                flush()
+            if result.get("isError"):
+                 response["error"] = {"code": -32603, "message": result["content"][0]["text"]}
+            else:
+                 response["result"] = result
+        else:
+            return
+    except Exception as e:
+        logger.exception("Failed to handle request %s", req_id)
+        response["error"] = {"code": -32603, "message": str(e)}
+
+    send(response)
+
+async def serve():
+    await authenticate_from_env()
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=2 ** 20)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    # Each request runs as its own task so a slow tool call never blocks reading the next one
+    tasks = set()
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # Line longer than the reader limit; asyncio drops it from the buffer
+                logger.error("Discarding oversized request line")
+                send_error(-32700, "Request too large")
+                continue
             if not line:
                 break
-            request = json.loads(line)
-            req_id = request.get("id")
-            
-            response = {"jsonrpc": "2.0", "id": req_id}
-            
-            if request.get("method") == "initialize":
-                response["result"] = {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {"tools": {}},
-                    "serverInfo": {"name": "geepers-bluesky", "version": "1.0.0"}
-                }
-            elif request.get("method") == "tools/list":
-                response["result"] = {"tools": list_tools()}
-            elif request.get("method") == "tools/call":
-                result = handle_call_tool(request["params"]["name"], request["params"]["arguments"])
-                if result.get("isError"):
-                     response["error"] = {"code": -32603, "message": result["content"][0]["text"]}
-                else:
-                     response["result"] = result
-            else:
+            if not line.strip():
+                continue
+            try:
+                request = json_loads(line)
+            except Exception as e:
+                logger.error(f"Discarding malformed request: {e}")
+                send_error(-32700, "Parse error")
+                continue
+            if not isinstance(request, dict):
+                send_error(-32600, "Invalid request")
                 continue
-                
-            print(json.dumps(response), flush=True)
-        except Exception:
-            break
+            task = asyncio.create_task(dispatch(request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await api.close()
+
+def run_server():
+    asyncio.run(serve())
 
 if __name__ == "__main__":
     run_server()